@@ -1,28 +1,104 @@
 import numpy as np
 import math
-import csv
 import matplotlib.pyplot as plt
 import pandas as pd
 import mplcursors
 from scipy.stats import chi2, multivariate_normal
+from numba import njit, vectorize
+
+
+@njit(cache=True, inline='always')
+def inv3(S):
+    # Closed-form cofactor inverse of a 3x3 matrix
+    a, b, c = S[0, 0], S[0, 1], S[0, 2]
+    d, e, f = S[1, 0], S[1, 1], S[1, 2]
+    g, h, i = S[2, 0], S[2, 1], S[2, 2]
+    A = e * i - f * h
+    B = f * g - d * i
+    C = d * h - e * g
+    det = a * A + b * B + c * C
+    inv = np.empty((3, 3), dtype=S.dtype)
+    inv[0, 0] = A / det
+    inv[0, 1] = (c * h - b * i) / det
+    inv[0, 2] = (b * f - c * e) / det
+    inv[1, 0] = B / det
+    inv[1, 1] = (a * i - c * g) / det
+    inv[1, 2] = (c * d - a * f) / det
+    inv[2, 0] = C / det
+    inv[2, 1] = (b * g - a * h) / det
+    inv[2, 2] = (a * e - b * d) / det
+    return inv
+
+
+@njit(cache=True, fastmath=True)
+def _predict(Sf, Pf, dt, plant_noise, Q):
+    # Q only has the 12 entries below set, so it is refreshed in place
+    T_2 = (dt * dt) / 2.0
+    T_3 = (dt * dt * dt) / 3.0
+    for i in range(3):
+        Q[i, i] = T_3 * plant_noise
+        Q[i, i + 3] = T_2 * plant_noise
+        Q[i + 3, i] = T_2 * plant_noise
+        Q[i + 3, i + 3] = dt * plant_noise
+
+    # Phi = I + dt * shift, so Phi @ Sf and Phi @ Pf @ Phi' reduce to
+    # block-wise updates on the position/velocity partitions
+    Sp = np.empty_like(Sf)
+    Sp[:3] = Sf[:3] + dt * Sf[3:]
+    Sp[3:] = Sf[3:]
+
+    P_pp, P_pv, P_vp, P_vv = Pf[:3, :3], Pf[:3, 3:], Pf[3:, :3], Pf[3:, 3:]
+    Pp = np.empty_like(Pf)
+    Pp[:3, :3] = P_pp + dt * (P_vp + P_pv) + dt * dt * P_vv
+    Pp[:3, 3:] = P_pv + dt * P_vv
+    Pp[3:, :3] = P_vp + dt * P_vv
+    Pp[3:, 3:] = P_vv
+    Pp += Q
+    return Sp, Pp
+
+
+@njit(cache=True, fastmath=True)
+def _innovation(Sp, Pp, R):
+    # H = [I3 | 0], so H @ X only selects the position rows/columns of X
+    Hx = Sp[:3].copy()
+    S = Pp[:3, :3] + R
+    Sinv = inv3(S)
+    K = np.dot(np.ascontiguousarray(Pp[:, :3]), Sinv)
+    return Hx, Sinv, K
+
+
+@njit(cache=True, fastmath=True)
+def _update(Sp, Pp, Z, Hx, K, R):
+    Inn = Z - Hx
+    Sf = Sp + np.dot(K, Inn)
+    # I - K H = [[I - K_top, 0], [-K_bot, I]] only touches the first three
+    # columns, so (I - K H) Pp is a rank-3 correction of Pp
+    M = Pp - np.dot(K, Pp[:3])
+    # Joseph form (I - K H) Pp (I - K H)' + K R K', with the right-hand
+    # factor reduced the same way, keeps Pf symmetric positive definite
+    Pf = M - np.dot(np.ascontiguousarray(M[:, :3]), K.T) + np.dot(np.dot(K, R), K.T)
+    return Sf, Pf
+
+
+@njit(cache=True, fastmath=True)
+def _gate(Z, Hx, Sinv):
+    Inn = Z - Hx
+    return np.dot(np.dot(Inn.T, Sinv), Inn)[0, 0]
 
-# Define lists to store results
-r = []
-el = []
-az = []
 
 class CVFilter:
     def __init__(self):
-        self.Sf = np.zeros((6, 1))  # Filter state vector
-        self.Pf = np.eye(6)  # Filter state covariance matrix
-        self.Sp = np.zeros((6, 1))  # Predicted state vector
-        self.Pp = np.eye(6)  # Predicted state covariance matrix
+        # The filter math runs in float32; measurement times stay float64
+        self.Sf = np.zeros((6, 1), dtype=np.float32)  # Filter state vector
+        self.Pf = np.eye(6, dtype=np.float32)  # Filter state covariance matrix
+        self.Sp = np.zeros((6, 1), dtype=np.float32)  # Predicted state vector
+        self.Pp = np.eye(6, dtype=np.float32)  # Predicted state covariance matrix
         self.plant_noise = 20  # Plant noise covariance
         self.H = np.eye(3, 6)  # Measurement matrix
-        self.R = np.eye(3)  # Measurement noise covariance
+        self.R = np.eye(3, dtype=np.float32)  # Measurement noise covariance
         self.Meas_Time = 0  # Measured time
         self.prev_Time = 0
-        self.Q = np.eye(6)
+        self.Q = np.eye(6, dtype=np.float32)
         self.Phi = np.eye(6)
         self.Z = np.zeros((3, 1)) 
         self.Z1 = np.zeros((3, 1)) # Measurement vector
@@ -30,6 +106,7 @@ class CVFilter:
         self.first_rep_flag = False
         self.second_rep_flag = False
         self.gate_threshold = 9000.21  # 95% confidence interval for Chi-square distribution with 3 degrees of freedom
+        self._cache_innovation()
 
     def initialize_filter_state(self, x, y, z, vx, vy, vz, time):
         if not self.first_rep_flag:
@@ -59,99 +136,72 @@ class CVFilter:
 
     def predict_step(self, current_time):
         dt = current_time - self.prev_Time
-        T_2=(dt*dt)/2.0
-        T_3=(dt*dt*dt)/3.0
-        self.Phi[0, 3] = dt
-        self.Phi[1, 4] = dt
-        self.Phi[2, 5] = dt
-              
-        self.Q[0, 0] = T_3
-        self.Q[1, 1] = T_3
-        self.Q[2, 2] = T_3
-        self.Q[0, 3] = T_2
-        self.Q[1, 4] = T_2
-        self.Q[2, 5] = T_2
-        self.Q[3, 0] = T_2
-        self.Q[4, 1] = T_2
-        self.Q[5, 2] = T_2
-        self.Q[3, 3] = dt
-        self.Q[4, 4] = dt
-        self.Q[5, 5] = dt
-        self.Q = self.Q * self.plant_noise
-        self.Sp = np.dot(self.Phi, self.Sf)
-        self.Pp = np.dot(np.dot(self.Phi, self.Pf), self.Phi.T) + self.Q
+        self.Sp, self.Pp = _predict(self.Sf, self.Pf, np.float32(dt), np.float32(self.plant_noise), self.Q)
         self.Meas_Time = current_time
+        self._cache_innovation()
+
+    def _cache_innovation(self):
+        # Predicted measurement, S^-1 and the gain only depend on the
+        # prediction, so gating, likelihoods and the update all reuse them
+        self._Hx, self._Sinv, self._K = _innovation(self.Sp, self.Pp, self.R)
 
     def update_step(self, Z):
-        Inn = Z - np.dot(self.H, self.Sp)
-        S = np.dot(self.H, np.dot(self.Pp, self.H.T)) + self.R
-        K = np.dot(np.dot(self.Pp, self.H.T), np.linalg.inv(S))
-        self.Sf = self.Sp + np.dot(K, Inn)
-        self.Pf = np.dot(np.eye(6) - np.dot(K, self.H), self.Pp)
+        Z = np.asarray(Z, dtype=np.float32)
+        self.Sf, self.Pf = _update(self.Sp, self.Pp, Z, self._Hx, self._K, self.R)
 
     def gating(self, Z):
-        Inn = Z - np.dot(self.H, self.Sp)
-        S = np.dot(self.H, np.dot(self.Pp, self.H.T)) + self.R
-        d2 = np.dot(np.dot(np.transpose(Inn), np.linalg.inv(S)), Inn)
+        Z = np.asarray(Z, dtype=np.float32)
+        d2 = _gate(Z, self._Hx, self._Sinv)
         return d2 < self.gate_threshold
 
 
 
+@njit(cache=True)
+def _group_ids(t, max_time_diff):
+    # A group starts whenever a time exceeds the current group's base time
+    # by more than max_time_diff, so the base time only moves on a reset
+    group_id = np.empty(t.shape[0], dtype=np.int64)
+    gid = 0
+    base_time = t[0]
+    for i in range(t.shape[0]):
+        if t[i] - base_time > max_time_diff:
+            gid += 1
+            base_time = t[i]
+        group_id[i] = gid
+    return group_id
+
+
 def form_measurement_groups(measurements, max_time_diff=0.050):
-    measurement_groups = []
-    current_group = []
-    base_time = measurements[0][3]
+    # measurements is an (N, 4) array of r, az, el, t rows; groups are
+    # returned as contiguous (k, 4) blocks of it
+    if len(measurements) == 0:
+        return []
+    group_id = _group_ids(np.ascontiguousarray(measurements[:, 3]), float(max_time_diff))
+    return np.split(measurements, np.where(np.diff(group_id))[0] + 1)
 
-    for measurement in measurements:
-        if measurement[3] - base_time <= max_time_diff:
-            current_group.append(measurement)
-        else:
-            measurement_groups.append(current_group)
-            current_group = [measurement]
-            base_time = measurement[3]
 
-    if current_group:
-        measurement_groups.append(current_group)
+def read_measurements_from_csv(file_path):
+    # Adjust column indices based on CSV file structure: MR, MA, ME, MT
+    # round_trip parsing gives the same values as float() on each field
+    data = pd.read_csv(file_path, usecols=[7, 8, 9, 10], float_precision='round_trip')
+    mr, ma, me, mt = data.to_numpy(dtype=np.float64).T
+    x, y, z = sph2cart_vec(ma, me, mr)  # Convert spherical to Cartesian coordinates
+    r, az, el = cart2sph_vec(x, y, z)  # Convert Cartesian to spherical coordinates
+    return r, az, el, mt
 
-    return measurement_groups
 
+def chi_square_distances(measurements, kalman_filter):
+    # Innovation covariance is the same for every measurement in the group,
+    # so the squared distances of all measurements are one batched pass
+    diff = measurements[:, :3] - kalman_filter._Hx.ravel()
+    return np.einsum('ni,ij,nj->n', diff, kalman_filter._Sinv, diff)
 
-def read_measurements_from_csv(file_path):
-    measurements = []
-    with open(file_path, 'r') as file:
-        reader = csv.reader(file)
-        next(reader)  # Skip header if exists
-        for row in reader:
-            # Adjust column indices based on CSV file structure
-            mr = float(row[7])  # MR column
-            ma = float(row[8])  # MA column
-            me = float(row[9])  # ME column
-            mt = float(row[10])  # MT column
-            x, y, z = sph2cart(ma, me, mr)  # Convert spherical to Cartesian coordinates
-            # print("Cartesian coordinates (x, y, z):", x, y, z)
-            r, az, el = cart2sph(x, y, z)  # Convert Cartesian to spherical coordinates
-            # print("Spherical coordinates (r, az, el):", r, az, el)
-            measurements.append((r, az, el, mt))
-    return measurements
-
-
-def chi_square_clustering(Z, kalman_filter):
-    Inn = Z - np.dot(kalman_filter.H, kalman_filter.Sp)
-    S = np.dot(kalman_filter.H, np.dot(kalman_filter.Pp, kalman_filter.H.T)) + kalman_filter.R
-    d2 = np.dot(np.dot(np.transpose(Inn), np.linalg.inv(S)),Inn)
-    gate_threshold=kalman_filter.gate_threshold
-    print("gate thres:",gate_threshold)
-    print("d2",d2)
-    return d2 < gate_threshold
-
-
-def form_clusters(measurements, kalman_filter):
-    clusters = []
-    for measurement in measurements:
-        Z = np.array([[measurement[0]], [measurement[1]], [measurement[2]]])
-        if chi_square_clustering(Z,kalman_filter):
-            clusters.append(measurement)
-    return clusters
+
+def gate_measurements(measurements, kalman_filter):
+    # Returns the in-gate mask together with the distances, so callers can
+    # hand the gated distances on to jpda instead of recomputing them
+    d2 = chi_square_distances(measurements, kalman_filter)
+    return d2 < kalman_filter.gate_threshold, d2
 
 
 def generate_hypotheses(clusters):
@@ -161,101 +211,137 @@ def generate_hypotheses(clusters):
     return hypotheses
 
 
-def compute_hypothesis_likelihood(hypothesis, kalman_filter):
-    Z = np.array([[hypothesis[0]], [hypothesis[1]], [hypothesis[2]]])
-    Inn = Z - np.dot(kalman_filter.H, kalman_filter.Sp)
-    S = np.dot(kalman_filter.H, np.dot(kalman_filter.Pp, kalman_filter.H.T)) + kalman_filter.R
-    likelihood = np.exp(-0.5 * np.dot(np.dot(Inn.T, np.linalg.inv(S)), Inn))
-    return likelihood
-
-
-def jpda(clusters, kalman_filter):
+def jpda(clusters, kalman_filter, d2=None):
     hypotheses = generate_hypotheses(clusters)
 
     if not hypotheses:
         return None
 
-    hypothesis_likelihoods = [compute_hypothesis_likelihood(h, kalman_filter) for h in hypotheses]
-    total_likelihood = sum(hypothesis_likelihoods)
+    # d2 can be passed in when the caller already gated the clusters, so the
+    # quadratic form is only evaluated once per prediction
+    if d2 is None:
+        d2 = chi_square_distances(np.asarray(hypotheses, dtype=float), kalman_filter)
+    in_gate = np.where(d2 < kalman_filter.gate_threshold)[0]
+
+    if not len(in_gate):
+        return None
+
+    # Likelihoods are only evaluated for hypotheses inside the gate
+    hypothesis_likelihoods = np.exp(-0.5 * d2[in_gate])
+    total_likelihood = hypothesis_likelihoods.sum()
 
     if total_likelihood == 0:
-        marginal_probabilities = [1.0 / len(hypotheses)] * len(hypotheses)
+        marginal_probabilities = np.full(len(in_gate), 1.0 / len(in_gate))
     else:
-        marginal_probabilities = [likelihood / total_likelihood for likelihood in hypothesis_likelihoods]
+        marginal_probabilities = hypothesis_likelihoods / total_likelihood
 
-    best_hypothesis_index = np.argmax(marginal_probabilities)
+    best_hypothesis_index = in_gate[np.argmax(marginal_probabilities)]
     best_hypothesis = hypotheses[best_hypothesis_index]
 
     return best_hypothesis
 
-def sph2cart(az, el, r):
-    x = r * np.cos(el * np.pi / 180) * np.sin(az * np.pi / 180)
-    y = r * np.cos(el * np.pi / 180) * np.cos(az * np.pi / 180)
-    z = r * np.sin(el * np.pi / 180)
+
+def sph2cart_scalar(az, el, r):
+    # Scalar inputs: math avoids the ufunc dispatch of np.cos/np.sin
+    el_rad = el * math.pi / 180
+    az_rad = az * math.pi / 180
+    x = r * math.cos(el_rad) * math.sin(az_rad)
+    y = r * math.cos(el_rad) * math.cos(az_rad)
+    z = r * math.sin(el_rad)
     return x, y, z
 
-def cart2sph(x, y, z):
-    r = np.sqrt(x**2 + y**2 + z**2)
-    el = math.atan2(z, np.sqrt(x**2 + y**2)) * 180 / np.pi
-    az = math.atan2(y, x)
 
-    if x > 0.0:
-        az = np.pi / 2 - az
-    else:
-        az = 3 * np.pi / 2 - az
+# Compiled per-component ufuncs: each fuses the trig chain for one
+# Cartesian coordinate, so whole columns convert without temporaries
+@vectorize(['float64(float64, float64, float64)'], target='parallel', fastmath=True, cache=True)
+def _sx(az, el, r):
+    return r * math.cos(el * math.pi / 180) * math.sin(az * math.pi / 180)
 
-    az = az * 180 / np.pi
 
-    if az < 0.0:
-        az = 360 + az
+@vectorize(['float64(float64, float64, float64)'], target='parallel', fastmath=True, cache=True)
+def _sy(az, el, r):
+    return r * math.cos(el * math.pi / 180) * math.cos(az * math.pi / 180)
 
-    if az > 360:
-        az = az - 360
 
-    return r, az, el
+@vectorize(['float64(float64, float64, float64)'], target='parallel', fastmath=True, cache=True)
+def _sz(az, el, r):
+    return r * math.sin(el * math.pi / 180)
 
 
-def cart2sph2(x:float,y:float,z:float,filtered_values_csv):
-    for i in range(len(filtered_values_csv)):
-    #print(np.array(y))
-    #print(np.array(z))
-        r.append(np.sqrt(x[i]**2 + y[i]**2 + z[i]**2))
-        el.append(math.atan(z[i]/np.sqrt(x[i]**2 + y[i]**2))*180/3.14)
-        az.append(math.atan(y[i]/x[i]))
-         
-        if x[i] > 0.0:                
-            az[i] = 3.14/2 - az[i]
-        else:
-            az[i] = 3*3.14/2 - az[i]       
-        
-        az[i]=az[i]*180/3.14 
+def sph2cart_vec(az, el, r):
+    return _sx(az, el, r), _sy(az, el, r), _sz(az, el, r)
 
-        if(az[i]<0.0):
-            az[i]=(360 + az[i])
-    
-        if(az[i]>360):
-            az[i]=(az[i] - 360)   
-      
 
-        # print("Row ",i+1)
-        # print("range:", r)
-        # print("azimuth", az)
-        # print("elevation",el)s
-        # print()
-  
-    return r,az,el
+def cart2sph_vec(x, y, z):
+    r = np.sqrt(x**2 + y**2 + z**2)
+    el = np.arctan2(z, np.sqrt(x**2 + y**2)) * 180 / np.pi
+    az = np.arctan2(y, x)
+    az = np.where(x > 0.0, np.pi / 2 - az, 3 * np.pi / 2 - az)
+    az = az * 180 / np.pi
+    az = np.where(az < 0.0, 360 + az, az)
+    az = np.where(az > 360, az - 360, az)
+    return r, az, el
 
 
+def cart2sph2(x, y, z):
+    r = np.sqrt(x**2 + y**2 + z**2)
+    el = np.degrees(np.arctan2(z, np.sqrt(x**2 + y**2)))
+    # Azimuth is measured clockwise from the y axis
+    az = np.degrees(np.pi / 2 - np.arctan2(y, x)) % 360
+    return r, az, el
+
+
+def process_group(group, kalman_filter, t, rnge, azme, elem, k):
+    # Runs every measurement of one group through the filter, writing the
+    # filtered outputs from index k on and returning the next free index;
+    # the filter state carries over to the next group
+    for i, (rng, azm, ele, mt) in enumerate(group):
+        print(f"Measurement {i + 1}: (az={rng}, el={azm}, r={ele}, t={mt})")
+        x,y,z=sph2cart_scalar(azm,ele,rng)
+        if not kalman_filter.first_rep_flag:
+            kalman_filter.initialize_filter_state(x, y, z, 0, 0, 0, mt)
+            print("Initialized Filter state:",kalman_filter.Sf.flatten())
+
+        elif kalman_filter.first_rep_flag and not kalman_filter.second_rep_flag:
+            kalman_filter.initialize_filter_state(x, y, z, 0, 0, 0, mt)
+            print("Initialized Filter state 2nd M:",kalman_filter.Sf.flatten())
+        else:
+            kalman_filter.initialize_filter_state(x, y, z, 0, 0, 0, mt)
+            kalman_filter.predict_step(mt)
+
+            in_gate, d2 = gate_measurements(group, kalman_filter)
+            clusters = group[in_gate]
+            print(f"No of Clusters formed: {len(clusters)}")
+            print(f"Clusters formed: {clusters.tolist()}")
+                
+            hypotheses=generate_hypotheses(clusters)
+            print(f"No of hypotheses formed: {len(hypotheses)}")
+            print(f"hypotheses formed: {[h.tolist() for h in hypotheses]}")
+
+            if len(clusters):
+                best_hypothesis = jpda(clusters, kalman_filter, d2[in_gate])
+                print("best_hypothesis:",best_hypothesis.tolist())
+                # if best_hypothesis:
+                Z = np.array([[best_hypothesis[0]], [best_hypothesis[1]], [best_hypothesis[2]]])
+                kalman_filter.update_step(Z)
+                print("Updated filter state:", kalman_filter.Sf.flatten())
+
+                # Convert to spherical coordinates for plotting
+                rnge[k] = kalman_filter.Sf[0, 0]
+                azme[k] = kalman_filter.Sf[1, 0]
+                elem[k] = kalman_filter.Sf[2, 0]
+                t[k] = mt
+                k += 1
+    return k
 
-time_list=[]
-t=[]
 
 def main():
     # File path for measurements CSV
     file_path = 'ttk_84_test.csv'
 
     # Read measurements from CSV
-    measurements = read_measurements_from_csv(file_path)
+    r, az, el, mt = read_measurements_from_csv(file_path)
+    measurements = np.column_stack((r, az, el, mt))
     
     kalman_filter = CVFilter()
     
@@ -265,7 +351,7 @@ def main():
     filtered_values_csv = df_predicted[['F_TIM', 'F_X', 'F_Y', 'F_Z']].values
     measured_values_csv = df_predicted[['MT', 'MR', 'MA', 'ME']].values
 
-    A = cart2sph2(filtered_values_csv[:,1], filtered_values_csv[:,2], filtered_values_csv[:,3],filtered_values_csv)
+    A = cart2sph2(filtered_values_csv[:,1], filtered_values_csv[:,2], filtered_values_csv[:,3])
     number= 1000
 
     result=np.divide(A[0],number)              
@@ -279,56 +365,24 @@ def main():
     # el_pred=[]
     # az_pred=[]
     # r_pred=[]
-    t=[]
-    rnge=[]
-    azme=[]
-    elem=[]
-
-    # Process each group of measurements
+    # At most one filtered output per measurement
+    N = len(measurements)
+    t = np.empty(N)
+    rnge = np.empty(N)
+    azme = np.empty(N)
+    elem = np.empty(N)
+    k = 0
+
+    # Process each group of measurements. One filter tracks across all
+    # groups, so they are processed in order.
     for group_idx, group in enumerate(measurement_groups):
         print(f"Processing measurement group {group_idx + 1}...")
-        
-        for i, (rng, azm, ele, mt) in enumerate(group):
-            print(f"Measurement {i + 1}: (az={rng}, el={azm}, r={ele}, t={mt})")
-            x,y,z=sph2cart(azm,ele,rng)
-            if not kalman_filter.first_rep_flag:
-                kalman_filter.initialize_filter_state(x, y, z, 0, 0, 0, mt)
-                print("Initialized Filter state:",kalman_filter.Sf.flatten())
-
-            elif kalman_filter.first_rep_flag and not kalman_filter.second_rep_flag:
-                kalman_filter.initialize_filter_state(x, y, z, 0, 0, 0, mt)
-                print("Initialized Filter state 2nd M:",kalman_filter.Sf.flatten())
-            else:
-                kalman_filter.initialize_filter_state(x, y, z, 0, 0, 0, mt)
-                kalman_filter.predict_step(mt)
-
-                clusters = form_clusters(group, kalman_filter)
-                print(f"No of Clusters formed: {len(clusters)}")
-                print(f"Clusters formed: {clusters}")
-                
-                hypotheses=generate_hypotheses(clusters)
-                print(f"No of hypotheses formed: {len(hypotheses)}")
-                print(f"hypotheses formed: {hypotheses}")
-
-                if clusters:
-                    best_hypothesis = jpda(clusters, kalman_filter)
-                    print("best_hypothesis:",best_hypothesis)
-                    # if best_hypothesis:
-                    Z = np.array([[best_hypothesis[0]], [best_hypothesis[1]], [best_hypothesis[2]]])
-                    kalman_filter.update_step(Z)
-                    print("Updated filter state:", kalman_filter.Sf.flatten())
-
-                        # Convert to spherical coordinates for plotting
-                    r_val, az_val, el_val = (kalman_filter.Sf[0], kalman_filter.Sf[1], kalman_filter.Sf[2])
-                    rnge.append(r_val)
-                    azme.append(az_val)
-                    elem.append(el_val)
-                    t.append(mt)
+        k = process_group(group, kalman_filter, t, rnge, azme, elem, k)
 
     # Plot range (r) vs. time
     plt.figure(figsize=(12, 6))
     plt.subplot(facecolor="white")
-    plt.scatter(t, rnge, label='filtered range (code)', color='green', marker='*')
+    plt.scatter(t[:k], rnge[:k], label='filtered range (code)', color='green', marker='*')
     plt.scatter(filtered_values_csv[:, 0], result, label='filtered range (track id 31)', color='red', marker='*')
     plt.scatter(measured_values_csv[:, 0], measured_values_csv[:, 1], label='measured range (code)', color='blue', marker='o')
     plt.xlabel('Time', color='black')
@@ -343,7 +397,7 @@ def main():
     # Plot azimuth (az) vs. time
     plt.figure(figsize=(12, 6))
     plt.subplot(facecolor="white")
-    plt.scatter(t, azme, label='filtered azimuth (code)', color='green', marker='*')
+    plt.scatter(t[:k], azme[:k], label='filtered azimuth (code)', color='green', marker='*')
     plt.scatter(filtered_values_csv[:, 0], A[1], label='filtered azimuth (track id 31)', color='red', marker='*')
     plt.scatter(measured_values_csv[:, 0], measured_values_csv[:, 2], label='measured azimuth (code)', color='blue', marker='o')
     plt.xlabel('Time', color='black')
@@ -358,7 +412,7 @@ def main():
     # Plot elevation (el) vs. time
     plt.figure(figsize=(12, 6))
     plt.subplot(facecolor="white")
-    plt.scatter(t, elem, label='filtered elevation (code)', color='green', marker='*')
+    plt.scatter(t[:k], elem[:k], label='filtered elevation (code)', color='green', marker='*')
     plt.scatter(filtered_values_csv[:, 0], A[2], label='filtered elevation (track id 31)', color='red', marker='*')
     plt.scatter(measured_values_csv[:, 0], measured_values_csv[:, 3], label='measured elevation (code)', color='blue', marker='o')
     plt.xlabel('Time', color='black')